@@ -1,6 +1,7 @@
-import os, sqlite3, csv, tkinter as tk
+import os, io, sqlite3, csv, tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import date
+from itertools import chain
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -26,113 +27,304 @@ FONT_HERO  = ("Segoe UI", 28, "bold")
 FONT_SUB   = ("Segoe UI", 12, "bold")
 FONT       = ("Segoe UI", 10)
 
+# (even-row tags, odd-row tags), picked by row index & 1 so rendering builds no tag tuples
+_STRIPE   = (('even',), ('odd',))
+_STRIPE_P = (('pending','even'), ('pending','odd'))
+_STRIPE_D = (('delivered','even'), ('delivered','odd'))
 
-def get_conn(): return sqlite3.connect(DB_PATH)
+
+CONN = None  # single shared connection, opened once by init_db()
+HAS_FTS = False  # set by init_db(): people_fts needs FTS5 with the trigram tokenizer (SQLite 3.34+)
+
+def get_conn(): return CONN
 
 def init_db():
-    with get_conn() as con:
-        cur = con.cursor()
-        cur.executescript("""
-        CREATE TABLE IF NOT EXISTS people(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL, area TEXT NOT NULL, age INTEGER
-        );
-        CREATE TABLE IF NOT EXISTS aid_types(
-            id INTEGER PRIMARY KEY AUTOINCREMENT, aid_name TEXT UNIQUE NOT NULL
-        );
-        CREATE TABLE IF NOT EXISTS aid_requests(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            person_id INTEGER NOT NULL, aid_type TEXT NOT NULL, request_date TEXT NOT NULL,
-            FOREIGN KEY(person_id) REFERENCES people(id)
-        );
-        CREATE TABLE IF NOT EXISTS aid_delivered(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            request_id INTEGER NOT NULL, item_given TEXT NOT NULL, delivery_date TEXT NOT NULL,
-            FOREIGN KEY(request_id) REFERENCES aid_requests(id)
-        );
-        """)
-        cur.executemany("INSERT OR IGNORE INTO aid_types(aid_name) VALUES(?)",
-                        [("Food",), ("Medicine",), ("Shelter",), ("Clothing",), ("Water",)])
-        con.commit()
+    global CONN
+    CONN = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    cur = CONN.cursor()
+    # Set once on the shared connection: WAL lets the tab refreshes read while a write commits.
+    cur.executescript("""
+    PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000; PRAGMA mmap_size=268435456;
+    """)
+    fts_synced = cur.execute("SELECT 1 FROM sqlite_master WHERE name='people_fts_ai'").fetchone()
+    # Schema + seed rows in one transaction: _create_schema's script opens it, the COMMIT closes it.
+    try:
+        _create_schema(cur, fts_synced)
+        cur.execute("COMMIT")
+    except Exception:
+        if CONN.in_transaction: CONN.execute("ROLLBACK")
+        raise
+
+def _create_schema(cur, fts_synced):
+    global HAS_FTS
+    cur.executescript("""
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS people(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL, area TEXT NOT NULL, age INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS aid_types(
+        id INTEGER PRIMARY KEY AUTOINCREMENT, aid_name TEXT UNIQUE NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS aid_requests(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        person_id INTEGER NOT NULL, aid_type TEXT NOT NULL, request_date TEXT NOT NULL,
+        delivered INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY(person_id) REFERENCES people(id)
+    );
+    CREATE TABLE IF NOT EXISTS aid_delivered(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        request_id INTEGER NOT NULL, item_given TEXT NOT NULL, delivery_date TEXT NOT NULL,
+        FOREIGN KEY(request_id) REFERENCES aid_requests(id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_req_person ON aid_requests(person_id);
+    CREATE INDEX IF NOT EXISTS idx_del_req ON aid_delivered(request_id);
+    CREATE INDEX IF NOT EXISTS idx_people_area ON people(area);
+    """)
+    # trigram index over people so search()'s '%area%' LIKE is answered from the index
+    try:
+        cur.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS people_fts
+                       USING fts5(name, area, content='people', content_rowid='id', tokenize='trigram')""")
+        cur.execute("SELECT rowid FROM people_fts LIMIT 0")   # table may predate a downgrade of SQLite
+        HAS_FTS = True
+    except sqlite3.OperationalError:
+        HAS_FTS = False
+    if HAS_FTS:
+        cur.execute("""CREATE TRIGGER IF NOT EXISTS people_fts_ai AFTER INSERT ON people BEGIN
+                       INSERT INTO people_fts(rowid,name,area) VALUES (new.id,new.name,new.area);
+                       END""")
+        cur.execute("""CREATE TRIGGER IF NOT EXISTS people_fts_ad AFTER DELETE ON people BEGIN
+                       INSERT INTO people_fts(people_fts,rowid,name,area) VALUES ('delete',old.id,old.name,old.area);
+                       END""")
+        cur.execute("""CREATE TRIGGER IF NOT EXISTS people_fts_au AFTER UPDATE ON people BEGIN
+                       INSERT INTO people_fts(people_fts,rowid,name,area) VALUES ('delete',old.id,old.name,old.area);
+                       INSERT INTO people_fts(rowid,name,area) VALUES (new.id,new.name,new.area);
+                       END""")
+        if not fts_synced: cur.execute("INSERT INTO people_fts(people_fts) VALUES ('rebuild')")
+    else:
+        # without the module the sync triggers would break every insert; the index is rebuilt
+        # once a capable SQLite opens the database again (the triggers are missing by then)
+        for t in ("people_fts_ai", "people_fts_ad", "people_fts_au"): cur.execute(f"DROP TRIGGER IF EXISTS {t}")
+    if "delivered" not in [c[1] for c in cur.execute("PRAGMA table_info(aid_requests)")]:
+        cur.execute("ALTER TABLE aid_requests ADD COLUMN delivered INTEGER NOT NULL DEFAULT 0")
+        cur.execute("UPDATE aid_requests SET delivered=1 WHERE id IN (SELECT request_id FROM aid_delivered)")
+    # pending requests flag themselves, so listing them is a scan of this small partial index
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_req_pending ON aid_requests(id) WHERE delivered=0")
+    cur.execute("""CREATE TRIGGER IF NOT EXISTS aid_delivered_ai AFTER INSERT ON aid_delivered BEGIN
+                   UPDATE aid_requests SET delivered=1 WHERE id=new.request_id;
+                   END""")
+    cur.executemany("INSERT OR IGNORE INTO aid_types(aid_name) VALUES(?)",
+                    [("Food",), ("Medicine",), ("Shelter",), ("Clothing",), ("Water",)])
 
 def add_person(name, area, age):
-    with get_conn() as con:
-        con.execute("INSERT INTO people(name,area,age) VALUES (?,?,?)",
-                    (name, area, age if age else None))
+    return CONN.execute("INSERT INTO people(name,area,age) VALUES (?,?,?)",
+                        (name, area, age if age else None)).lastrowid
+
+def bulk_add_people(rows):
+    # rows can be any iterable, e.g. a generator over a CSV file; all of it goes in one transaction
+    CONN.execute("BEGIN")
+    try:
+        CONN.executemany("INSERT INTO people(name,area,age) VALUES (?,?,?)", rows)
+    except Exception:
+        CONN.execute("ROLLBACK"); raise
+    CONN.execute("COMMIT")
+
+def list_people(after_id=0):
+    return CONN.execute("SELECT id,name,area,COALESCE(age,'') FROM people WHERE id>? ORDER BY id DESC",
+                        (after_id,))
 
-def list_people():
-    with get_conn() as con:
-        return list(con.execute("SELECT id,name,area,COALESCE(age,'') FROM people ORDER BY id DESC"))
+_AID_TYPES_CACHE = None  # aid types are fixed after init_db(); reset to None if one is added
 
 def list_aid_types():
-    with get_conn() as con:
-        return [r[0] for r in con.execute("SELECT aid_name FROM aid_types ORDER BY aid_name")]
+    global _AID_TYPES_CACHE
+    if _AID_TYPES_CACHE is None:
+        _AID_TYPES_CACHE = [r[0] for r in CONN.execute("SELECT aid_name FROM aid_types ORDER BY aid_name")]
+    return _AID_TYPES_CACHE
 
 def add_request(pid, aid_type, req_date):
-    with get_conn() as con:
-        con.execute("INSERT INTO aid_requests(person_id,aid_type,request_date) VALUES (?,?,?)",
-                    (pid, aid_type, req_date))
+    CONN.execute("INSERT INTO aid_requests(person_id,aid_type,request_date) VALUES (?,?,?)",
+                 (pid, aid_type, req_date))
 
-def list_pending_requests():
+def list_pending_requests(after_id=0):
     q = """SELECT r.id,p.name,p.area,r.aid_type,r.request_date
            FROM aid_requests r JOIN people p ON p.id=r.person_id
-           LEFT JOIN aid_delivered d ON d.request_id=r.id
-           WHERE d.id IS NULL ORDER BY r.id DESC"""
-    with get_conn() as con: return list(con.execute(q))
+           WHERE r.delivered=0 AND r.id>? ORDER BY r.id DESC"""
+    return CONN.execute(q, (after_id,))
+
+def list_pending_labels():
+    # just what the Deliver tab's combobox shows
+    q = """SELECT r.id,p.name FROM aid_requests r JOIN people p ON p.id=r.person_id
+           WHERE r.delivered=0 ORDER BY r.id DESC"""
+    return CONN.execute(q)
 
 def mark_delivered(rid, item, d_date):
-    with get_conn() as con:
-        con.execute("INSERT INTO aid_delivered(request_id,item_given,delivery_date) VALUES (?,?,?)",
-                    (rid, item, d_date))
+    CONN.execute("INSERT INTO aid_delivered(request_id,item_given,delivery_date) VALUES (?,?,?)",
+                 (rid, item, d_date))
 
-def search(area="", status="All"):
-    q = """SELECT p.name,p.area,r.aid_type,r.request_date,
+# Only "All" needs the LEFT JOIN: pending rows have no delivery to join, delivered ones always do.
+_SEARCH_BASE = {
+    "All": """SELECT r.id,p.name,p.area,r.aid_type,r.request_date,
            CASE WHEN d.id IS NULL THEN 'PENDING' ELSE d.delivery_date END
            FROM aid_requests r JOIN people p ON p.id=r.person_id
-           LEFT JOIN aid_delivered d ON d.request_id=r.id"""
-    w, prm = [], []
-    if area: w.append("p.area LIKE ?"); prm.append(f"%{area}%")
-    if status=="Pending": w.append("d.id IS NULL")
-    elif status=="Delivered": w.append("d.id IS NOT NULL")
-    if w: q += " WHERE " + " AND ".join(w)
-    q += " ORDER BY r.id DESC"
-    with get_conn() as con: return list(con.execute(q, prm))
+           LEFT JOIN aid_delivered d ON d.request_id=r.id""",
+    "Pending": """SELECT r.id,p.name,p.area,r.aid_type,r.request_date,'PENDING'
+           FROM aid_requests r JOIN people p ON p.id=r.person_id""",
+    "Delivered": """SELECT r.id,p.name,p.area,r.aid_type,r.request_date,d.delivery_date
+           FROM aid_requests r JOIN people p ON p.id=r.person_id
+           JOIN aid_delivered d ON d.request_id=r.id""",
+}
+
+def _search_sql(area_mode, status):
+    # area_mode: None (no area filter), "fts" (people_fts index) or "like" (plain scan, no FTS5)
+    q = _SEARCH_BASE[status] + (" JOIN people_fts f ON f.rowid=p.id" if area_mode=="fts" else "")
+    w = ["r.id>?"] + {None: [], "fts": ["f.area LIKE ?"], "like": ["p.area LIKE ?"]}[area_mode]
+    if status=="Pending": w.append("r.delivered=0")
+    return q + " WHERE " + " AND ".join(w) + " ORDER BY r.id DESC"
+
+# Built once at import: constant SQL text per filter combination lets sqlite3's statement cache reuse it.
+_SEARCH_SQL = {(a, st): _search_sql(a, st) for a in (None, "fts", "like") for st in _SEARCH_BASE}
+
+def search(area="", status="All", after_id=0):
+    mode = ("fts" if HAS_FTS else "like") if area else None
+    q = _SEARCH_SQL.get((mode, status), _SEARCH_SQL[(mode, "All")])
+    return CONN.execute(q, (after_id, f"%{area}%") if area else (after_id,))
 
 def delivered_summary_by_area():
     q = """SELECT p.area,COUNT(*) FROM aid_delivered d
            JOIN aid_requests r ON r.id=d.request_id
            JOIN people p ON p.id=r.person_id
            GROUP BY p.area ORDER BY COUNT(*) DESC"""
-    with get_conn() as con: return list(con.execute(q))
-
-def export_to_csv(data, filename):
-    with open(filename,'w',newline='',encoding='utf-8') as f: csv.writer(f).writerows(data)
+    return CONN.execute(q)
 
-def make_entry(parent, label, width=20, row=0, col=0, **kw):
-    tk.Label(parent,text=label,bg=CARD,fg=TXT_DARK,font=FONT).grid(row=row,column=col,padx=8,sticky="w")
-    var=tk.StringVar(); e=ttk.Entry(parent,textvariable=var,font=FONT,width=width,**kw)
-    e.grid(row=row,column=col+1,padx=8); return var
+def report_counts():
+    q = """SELECT (SELECT COUNT(*) FROM people),
+                  (SELECT COUNT(*) FROM aid_requests),
+                  (SELECT COUNT(*) FROM aid_requests WHERE delivered=0),
+                  (SELECT COUNT(*) FROM aid_delivered)"""
+    return CONN.execute(q).fetchone()
 
-def make_combo(parent, label, values, width=20, row=0, col=0):
-    tk.Label(parent,text=label,bg=CARD,fg=TXT_DARK,font=FONT).grid(row=row,column=col,padx=8,sticky="w")
-    var=tk.StringVar(); cb=ttk.Combobox(parent,textvariable=var,font=FONT,width=width,state="readonly",values=values)
-    cb.grid(row=row,column=col+1,padx=8); return var,cb
+def export_to_csv(data, filename):
+    # 1 MiB binary buffer under the text layer: one write() syscall per MiB instead of per few KiB
+    with open(filename,'wb',buffering=1<<20) as raw, io.TextIOWrapper(raw,encoding='utf-8',newline='') as f:
+        csv.writer(f).writerows(data)
+
+def import_people_csv(filename):
+    # expects a Name,Area,Age header line, then one person per row
+    with open(filename,newline='',encoding='utf-8') as f:
+        rows=csv.reader(f); next(rows,None)
+        bulk_add_people(_checked_people(rows))
+
+def _checked_people(rows):
+    # same rules as the People form; a bad row aborts (and rolls back) the whole import
+    for r in rows:
+        if not r: continue
+        name, area, age = (r+["",""])[:3]
+        if not name or not area: raise ValueError(f"line {rows.line_num}: Name & Area required")
+        if age and not age.isdigit(): raise ValueError(f"line {rows.line_num}: Age must be number")
+        yield name, area, int(age) if age else None
+
+def make_form_row(parent, fields):
+    # fields: (label, width, values) per column pair; values=None gives an Entry, a list a readonly Combobox.
+    # Returns a (var, widget) pair per field.
+    Label, StringVar, Entry, Combobox, font = tk.Label, tk.StringVar, ttk.Entry, ttk.Combobox, FONT
+    out=[]
+    for i,(label,width,values) in enumerate(fields):
+        Label(parent,text=label,bg=CARD,fg=TXT_DARK,font=font).grid(row=0,column=2*i,padx=8,sticky="w")
+        var=StringVar()
+        w=(Entry(parent,textvariable=var,font=font,width=width) if values is None else
+           Combobox(parent,textvariable=var,font=font,width=width,state="readonly",values=values))
+        w.grid(row=0,column=2*i+1,padx=8); out.append((var,w))
+    return out
+
+class VirtualTree(ttk.Treeview):
+    """Treeview that keeps every row in a Python list and only holds the visible window as items.
+
+    Rows are (key, values, stripe) tuples, stripe being one of the _STRIPE pairs. The key is
+    only matched in the Python list (it need not be unique, so Tk picks its own item ids);
+    it may be None for rows nobody looks up later.
+    The scrollbar drives the window position instead of the widget's own yview.
+    """
+    def __init__(self, parent, sb, **kw):
+        super().__init__(parent, **kw)
+        self._sb=sb; self._rows=[]; self._first=0; self._window=int(kw.get("height",12))
+        self._height=0; self._metrics=None   # widget height; (heading + borders, row height) once measured
+        sb.configure(command=self._on_scroll)
+        self.bind("<Configure>", self._on_resize)
+        self.bind("<MouseWheel>", lambda e: self._scroll(-3 if e.delta>0 else 3))
+        self.bind("<Button-4>", lambda e: self._scroll(-3)); self.bind("<Button-5>", lambda e: self._scroll(3))
+
+    def set_rows(self, rows): self._rows=list(rows); self._first=0; self._render()
+
+    def prepend(self, rows):
+        if rows: self._rows[:0]=rows; self._render()
+
+    def iter_values(self): return (r[1] for r in self._rows)
+
+    def _index(self, key):
+        key=str(key)
+        return next((i for i,r in enumerate(self._rows) if r[0] is not None and str(r[0])==key), None)
+
+    def get_row(self, key):
+        i=self._index(key)
+        return None if i is None else self._rows[i]
+
+    def set_row(self, key, values, stripe=_STRIPE):
+        i=self._index(key)
+        if i is not None: self._rows[i]=(self._rows[i][0], values, stripe); self._render()
+
+    def drop(self, key):
+        i=self._index(key)
+        if i is not None: del self._rows[i]; self._render()
+
+    def _render(self):
+        n=len(self._rows); self._first=max(0, min(self._first, n-self._window))
+        self.delete(*self.get_children())
+        for i in range(self._first, min(n, self._first+self._window)):
+            _,values,stripe=self._rows[i]
+            self.insert("", "end", values=values, tags=stripe[i&1])
+        if self._metrics is None and self._height and n: self.after_idle(self._fit)
+        if n: self._sb.set(self._first/n, min(1.0, (self._first+self._window)/n))
+        else: self._sb.set(0.0, 1.0)
+
+    def _scroll(self, delta):
+        self._first+=delta; self._render(); return "break"
+
+    def _on_scroll(self, *args):
+        if args[0]=="moveto": self._first=int(float(args[1])*len(self._rows)); self._render()
+        else: self._scroll(int(args[1])*(self._window if args[2]=="pages" else 1))
+
+    def _on_resize(self, e): self._height=e.height; self._fit()
+
+    def _fit(self):
+        if self._metrics is None:
+            # measure a rendered item: its bbox y is the top border plus heading, x the border width
+            items=self.get_children(); box=self.bbox(items[0]) if items else ""
+            if not box: return
+            x,y,_,h=box; self._metrics=(y+x, h)
+        extra,h=self._metrics
+        window=max(1, (self._height-extra)//h)
+        if window!=self._window: self._window=window; self._render()
 
 def make_treeview(parent, cols, widths):
     frame=tk.Frame(parent,bg=CARD); frame.pack(fill="both",expand=True)
-    tree=ttk.Treeview(frame,columns=cols,show="headings",height=12)
+    sb=ttk.Scrollbar(frame,orient="vertical")
+    tree=VirtualTree(frame,sb,columns=cols,show="headings",height=12)
     for c,w in zip(cols,widths):
         tree.heading(c,text=c)
         tree.column(c,width=w,anchor="center" if c in ("ID","Age","Deliveries","Status") else "w")
-    sb=ttk.Scrollbar(frame,orient="vertical",command=tree.yview); tree.configure(yscrollcommand=sb.set)
     tree.pack(side="left",fill="both",expand=True); sb.pack(side="right",fill="y")
     tree.tag_configure('even',background=STRIPE_E); tree.tag_configure('odd',background=STRIPE_O)
     return tree
 
-def refresh_tree(tree, rows):
-    tree.delete(*tree.get_children())
-    for i,r in enumerate(rows):
-        tree.insert("", "end", values=r, tags=('even' if i%2==0 else 'odd',))
+# The list_*/search helpers return their cursor; these iterate it straight into the tree's row list.
+def refresh_tree(tree, rows): tree.set_rows((None, r, _STRIPE) for r in rows)
+
+def prepend_rows(tree, rows, last_id=0):
+    # rows come newest first with their id in column 0 (used as the row key).
+    # Returns the newest id seen so far.
+    new=[(r[0], r, _STRIPE) for r in rows]; tree.prepend(new)
+    return new[0][0] if new else last_id
 
 class DRDTApp(tk.Tk):
     def __init__(self):
@@ -182,30 +374,37 @@ class DRDTApp(tk.Tk):
 
        
         self.home    = HomeTab(self.nb, on_manage=lambda: self.nb.select(1), on_reports=lambda: self.nb.select(5))
-        self.people  = PeopleTab(self.nb)
-        self.request = RequestTab(self.nb)
-        self.deliver = DeliverTab(self.nb)
-        self.search  = SearchTab(self.nb)
-        self.reports = ReportsTab(self.nb)
-
-        for t, name in [
-            (self.home,   " Home "),
-            (self.people, " People "),
-            (self.request," Aid Request "),
-            (self.deliver," Deliver Aid "),
-            (self.search, " Search/Filter "),
-            (self.reports," Reports "),
-        ]: self.nb.add(t, text=name)
+        self.nb.add(self.home, text=" Home ")
+
+        # The other tabs are built into their placeholder frame on first visit (see _on_tab_changed);
+        # until then the attribute is None and notify() skips them.
+        self.people = self.request = self.deliver = self.search = self.reports = None
+        self._lazy = {}
+        for attr, cls, name in [
+            ("people",  PeopleTab,  " People "),
+            ("request", RequestTab, " Aid Request "),
+            ("deliver", DeliverTab, " Deliver Aid "),
+            ("search",  SearchTab,  " Search/Filter "),
+            ("reports", ReportsTab, " Reports "),
+        ]:
+            holder = ttk.Frame(self.nb); self.nb.add(holder, text=name)
+            self._lazy[str(holder)] = (attr, cls, holder)
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         
         for i, title in enumerate(["Home","People","Requests","Deliver","Search","Reports"]):
             navbtn(title, i)
 
-      
-        self.request.refresh_people()
-        self.deliver.refresh()
-        self.search.refresh()
-        self.reports.refresh()
+    def _on_tab_changed(self, _e):
+        lazy = self._lazy.pop(self.nb.select(), None)
+        if lazy:
+            attr, cls, holder = lazy
+            tab = cls(holder); tab.pack(fill="both", expand=True)
+            setattr(self, attr, tab)
+
+    def notify(self, attr, method, *args):
+        tab = getattr(self, attr)
+        if tab is not None: getattr(tab, method)(*args)
 
 class HomeTab(ttk.Frame):
     def __init__(self, parent, on_manage, on_reports):
@@ -280,95 +479,140 @@ class PeopleTab(ttk.Frame):
     def __init__(self,parent):
         super().__init__(parent, padding=15)
         form=tk.Frame(self,bg=CARD); form.pack(fill="x",pady=10)
-        self.name=make_entry(form,"Name:",25,0,0)
-        self.area=make_entry(form,"Area:",25,0,2)
-        self.age =make_entry(form,"Age:",10,0,4)
+        (self.name,_),(self.area,_),(self.age,_)=make_form_row(form,[("Name:",25,None),("Area:",25,None),("Age:",10,None)])
         ttk.Button(form,text="Add Person",command=self.on_add).grid(row=0,column=6,padx=10)
-        self.tree=make_treeview(self,("ID","Name","Area","Age"),(60,220,220,80)); self.refresh()
+        ttk.Button(form,text="Import CSV",command=self.on_import).grid(row=0,column=7)
+        self.tree=make_treeview(self,("ID","Name","Area","Age"),(60,220,220,80))
+        self._last_max_id=0; self.refresh()
 
     def on_add(self):
         if not self.name.get() or not self.area.get():
             return messagebox.showerror("Error","Name & Area required")
         if self.age.get() and not self.age.get().isdigit():
             return messagebox.showerror("Error","Age must be number")
-        add_person(self.name.get(),self.area.get(),int(self.age.get()) if self.age.get() else None)
+        name, area, age = self.name.get(), self.area.get(), int(self.age.get()) if self.age.get() else None
+        pid=add_person(name, area, age)
+        # we know the new row already: show it without re-querying (a new person has no requests yet,
+        # so the Search tab is unaffected)
+        self.tree.prepend([(pid, (pid, name, area, age or ""), _STRIPE)]); self._last_max_id=pid
+        app.notify("request", "append_person", pid, name, area)
         self.name.set(""); self.area.set(""); self.age.set("")
-        self.refresh(); app.request.refresh_people(); app.deliver.refresh(); app.search.refresh(); app.reports.refresh()
+        app.notify("reports", "refresh")
 
-    def refresh(self): refresh_tree(self.tree, list_people())
+    def on_import(self):
+        f = filedialog.askopenfilename(filetypes=[("CSV","*.csv")])
+        if not f: return
+        try: import_people_csv(f)
+        except (ValueError, IndexError, csv.Error, OSError, sqlite3.Error) as e:
+            return messagebox.showerror("Error", f"Import failed: {e}")
+        self.refresh(); app.notify("request", "refresh_people"); app.notify("search", "refresh_new"); app.notify("reports", "refresh")
+        messagebox.showinfo("Success", f"Imported: {f}")
+
+    def refresh(self): self._last_max_id=prepend_rows(self.tree, list_people(self._last_max_id), self._last_max_id)
 
 class RequestTab(ttk.Frame):
     def __init__(self,parent):
         super().__init__(parent, padding=15)
         form=tk.Frame(self,bg=CARD); form.pack(fill="x",pady=10)
-        self.person_var,self.cb_person=make_combo(form,"Person:",[],28,0,0)
-        self.aid_var,   self.cb_aid   =make_combo(form,"Aid Type:",list_aid_types(),20,0,2)
+        (self.person_var,self.cb_person),(self.aid_var,self.cb_aid)=make_form_row(form,[
+            ("Person:",28,[]), ("Aid Type:",20,list_aid_types())])
         self.date=tk.StringVar(value=str(date.today()))
         ttk.Entry(form,textvariable=self.date,width=12,state="readonly").grid(row=0,column=5)
         ttk.Button(form,text="Add Request",command=self.on_add).grid(row=0,column=6,padx=10)
         self.tree=make_treeview(self,("ID","Name","Area","Aid Type","Request Date"),(60,220,180,160,140))
+        self._last_max_id=0; self.refresh_people(); self.refresh()
 
     def refresh_people(self):
-        people=list_people()
-        self.cb_person['values']=[f"{p[0]} - {p[1]} ({p[2]})" for p in people]
-        if people: self.cb_person.current(0)
+        values=[f"{p[0]} - {p[1]} ({p[2]})" for p in list_people()]
+        self.cb_person['values']=values
+        if values: self.cb_person.current(0)
+
+    def append_person(self, pid, name, area):
+        # newest first, like refresh_people, without re-reading every person
+        self.cb_person['values']=(f"{pid} - {name} ({area})", *self.cb_person['values'])
+        self.cb_person.current(0)
 
     def on_add(self):
         if not self.person_var.get() or not self.aid_var.get():
             return messagebox.showerror("Error","Select person & aid")
         add_request(self.person_var.get().split(" - ")[0], self.aid_var.get(), self.date.get())
         self.aid_var.set("")
-        self.refresh(); app.deliver.refresh(); app.search.refresh(); app.reports.refresh()
+        self.refresh(); app.notify("deliver", "refresh"); app.notify("search", "refresh_new"); app.notify("reports", "refresh")
         messagebox.showinfo("Success","Aid request added")
 
-    def refresh(self): refresh_tree(self.tree, list_pending_requests())
+    def refresh(self):
+        self._last_max_id=prepend_rows(self.tree, list_pending_requests(self._last_max_id), self._last_max_id)
+
+    def drop_request(self, rid):
+        self.tree.drop(rid)
 
 class DeliverTab(ttk.Frame):
     def __init__(self,parent):
         super().__init__(parent, padding=15)
         form=tk.Frame(self,bg=CARD); form.pack(fill="x",pady=10)
-        self.req_var,self.cb_req = make_combo(form,"Request:",[],30,0,0)
-        self.items  = make_entry(form,"Items:",25,0,2)
-        self.d_date = make_entry(form,"Delivery Date:",12,0,4); self.d_date.set(str(date.today()))
+        (self.req_var,self.cb_req),(self.items,_),(self.d_date,_)=make_form_row(form,[
+            ("Request:",30,[]), ("Items:",25,None), ("Delivery Date:",12,None)])
+        self.d_date.set(str(date.today()))
         ttk.Button(form,text="Mark Delivered",command=self.on_deliver).grid(row=0,column=6)
         self.tree=make_treeview(self,("ID","Name","Area","Aid Type","Request Date"),(60,220,180,160,140))
+        self._last_max_id=0; self.refresh()
 
     def on_deliver(self):
         if not self.req_var.get() or not self.items.get():
             return messagebox.showerror("Error","Fill all fields")
-        mark_delivered(self.req_var.get().split(" - ")[0], self.items.get(), self.d_date.get())
+        rid=self.req_var.get().split(" - ")[0]
+        mark_delivered(rid, self.items.get(), self.d_date.get())
+        app.notify("request", "drop_request", rid); app.notify("search", "on_delivered", rid, self.d_date.get())
         self.items.set(""); self.req_var.set("")
-        self.refresh(); app.request.refresh(); app.search.refresh(); app.reports.refresh()
+        self.tree.drop(rid); self.refresh_combo(); app.notify("reports", "refresh")
         messagebox.showinfo("Success","Aid delivery recorded")
 
-    def refresh(self):
-        rows=list_pending_requests(); refresh_tree(self.tree, rows)
-        self.cb_req['values']=[f"{r[0]} - {r[1]}" for r in rows]
+    def refresh(self): self.refresh_tree_only(); self.refresh_combo()
+
+    def refresh_tree_only(self):
+        self._last_max_id=prepend_rows(self.tree, list_pending_requests(self._last_max_id), self._last_max_id)
+
+    def refresh_combo(self): self.cb_req['values']=[f"{r[0]} - {r[1]}" for r in list_pending_labels()]
 
 class SearchTab(ttk.Frame):
+    COLS=("Name","Area","Aid Type","Request Date","Status")
+
     def __init__(self,parent):
         super().__init__(parent, padding=15)
         form=tk.Frame(self,bg=CARD); form.pack(fill="x",pady=10)
-        self.area=make_entry(form,"Area:",25,0,0)
-        self.status,self.cb_status=make_combo(form,"Status:",["All","Pending","Delivered"],15,0,2); self.status.set("All")
+        (self.area,_),(self.status,self.cb_status)=make_form_row(form,[("Area:",25,None),("Status:",15,["All","Pending","Delivered"])])
+        self.status.set("All")
         ttk.Button(form,text="Search",command=self.refresh).grid(row=0,column=4,padx=6)
         ttk.Button(form,text="Export CSV",command=self.on_export).grid(row=0,column=5)
-        self.tree=make_treeview(self,("Name","Area","Aid Type","Request Date","Status"),(220,180,160,140,120))
+        self.tree=make_treeview(self,self.COLS,(220,180,160,140,120))
         self.tree.tag_configure('pending',foreground="#e74c3c"); self.tree.tag_configure('delivered',foreground="#27ae60")
+        self._filter=("","All"); self._last_max_id=0; self.refresh()
 
     def on_export(self):
         f = filedialog.asksaveasfilename(defaultextension=".csv",filetypes=[("CSV","*.csv")])
         if f:
-            data=[("Name","Area","Aid Type","Request Date","Status")]
-            for i in self.tree.get_children(): data.append(self.tree.item(i)['values'])
-            export_to_csv(data,f); messagebox.showinfo("Success", f"Exported: {f}")
+            # rows straight from the tree's Python-side list; no Tcl calls, no copy
+            export_to_csv(chain([self.COLS], self.tree.iter_values()),f); messagebox.showinfo("Success", f"Exported: {f}")
 
     def refresh(self):
-        rows=search(self.area.get(), self.status.get())
-        self.tree.delete(*self.tree.get_children())
-        for i,r in enumerate(rows):
-            tag = ('pending' if r[4]=='PENDING' else 'delivered')
-            self.tree.insert("", "end", values=r, tags=(tag,'even' if i%2==0 else 'odd'))
+        # Search button: apply the form's filter and rebuild from scratch
+        self._filter=(self.area.get(), self.status.get()); self.reload()
+
+    def reload(self):
+        self.tree.set_rows([]); self._last_max_id=0; self.refresh_new()
+
+    def refresh_new(self):
+        # only requests added since the last refresh, under the filter last searched with
+        new=[(r[0], r[1:], _STRIPE_P if r[5]=='PENDING' else _STRIPE_D)
+             for r in search(*self._filter, after_id=self._last_max_id)]
+        self.tree.prepend(new)
+        if new: self._last_max_id=new[0][0]
+
+    def on_delivered(self, rid, d_date):
+        if self._filter[1]=="Delivered": return self.reload()
+        if self._filter[1]=="Pending": return self.tree.drop(rid)
+        row=self.tree.get_row(rid)
+        if row: self.tree.set_row(rid, (*row[1][:4], d_date), _STRIPE_D)
 
 class ReportsTab(ttk.Frame):
     def __init__(self,parent):
@@ -378,31 +622,26 @@ class ReportsTab(ttk.Frame):
 
        
         stats=tk.Frame(self,bg=CARD); stats.pack(fill="x",pady=6)
-        self.people_v=tk.StringVar(value="0"); self.req_v=tk.StringVar(value="0")
-        self.pending_v=tk.StringVar(value="0"); self.deliv_v=tk.StringVar(value="0")
-        for i,(title,var) in enumerate([
-            ("Total People",self.people_v),
-            ("Total Requests",self.req_v),
-            ("Pending Deliveries",self.pending_v),
-            ("Delivered Items",self.deliv_v),
-        ]): self._card(stats,title,var,i)
+        self.people_lbl, self.req_lbl, self.pending_lbl, self.deliv_lbl = [
+            self._card(stats,title,i) for i,title in enumerate(
+                ["Total People","Total Requests","Pending Deliveries","Delivered Items"])]
 
       
-        self.tree=make_treeview(self,("Area","Deliveries"),(320,160))
+        self.tree=make_treeview(self,("Area","Deliveries"),(320,160)); self.refresh()
 
-    def _card(self,parent,title,var,col):
+    def _card(self,parent,title,col):
         card=tk.Frame(parent,bg="#f7fbfb",bd=1,relief="solid",padx=14,pady=10)
         card.grid(row=0,column=col, padx=8, sticky="nsew")
         tk.Label(card,text=title,bg="#f7fbfb",fg=MUTED,font=("Segoe UI",10)).pack(anchor="w")
-        tk.Label(card,textvariable=var,bg="#f7fbfb",fg=TXT_DARK,font=("Segoe UI",18,"bold")).pack(anchor="w")
+        value=tk.Label(card,text="0",bg="#f7fbfb",fg=TXT_DARK,font=("Segoe UI",18,"bold")); value.pack(anchor="w")
         parent.columnconfigure(col, weight=1)
+        return value
 
     def refresh(self):
-        self.people_v.set(len(list_people()))
-        self.pending_v.set(len(list_pending_requests()))
-        with get_conn() as con:
-            self.req_v.set(con.execute("SELECT COUNT(*) FROM aid_requests").fetchone()[0])
-            self.deliv_v.set(con.execute("SELECT COUNT(*) FROM aid_delivered").fetchone()[0])
+        # plain configure per card: one Tcl call each, no StringVar write + trace
+        people, reqs, pending, delivered = report_counts()
+        self.people_lbl.configure(text=str(people)); self.req_lbl.configure(text=str(reqs))
+        self.pending_lbl.configure(text=str(pending)); self.deliv_lbl.configure(text=str(delivered))
         refresh_tree(self.tree, delivered_summary_by_area())
 
 if __name__=="__main__":